@@ -0,0 +1,243 @@
+import argparse
+import os
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import My_Mods # type: ignore
+
+HOT_LINK_sheet_name = 'HOT LINK'
+ci_hub = 'City Id Hub'
+pop_POPTrackingWorkBook = 'POPTrackingWorkBook'
+sheet_pop = 'POP numbers'
+payroll_sheet_name = 'Payroll'
+
+ci_column = 'City Id'
+contract_column = 'Contract Amount'
+deviated_as_column = 'DEVIATED AS'
+
+CLASSIFICATIONS = ['Construction', 'Professional Services', 'Goods', 'Other Services']
+DEVIATIONS = ['Supplier', 'Sub-Contractor', 'Prime']
+SUFFIXES = ['LLC', 'Inc.', 'Corp.', 'Co.', 'Group, Inc.']
+WORDS = ['Alpha', 'Beacon', 'Cedar', 'Delta', 'Eagle', 'Frontier', 'Granite', 'Harbor', 'Summit', 'Keystone',
+         'Liberty', 'Metro', 'North', 'Pioneer', 'Quality', 'River', 'Sterling', 'Tri-State', 'United', 'Vista']
+
+
+def generate_workbooks(directory, n_city_ids=2000, hot_link_rows=20000, payroll_rows=3000, fuzzy_share=0.1, seed=0):
+    """
+    Writes synthetic Link Deviations, CITY ID, POP review and PayrollInfo workbooks shaped like the real ones.
+    Returns a dict of workbook name -> file path.
+    """
+    rng = np.random.default_rng(seed)
+    os.makedirs(directory, exist_ok=True)
+    paths = {
+        'hot_link': os.path.join(directory, 'Link Deviations.xlsx'),
+        'city_id': os.path.join(directory, 'CITY ID.xlsx'),
+        'pop_review': os.path.join(directory, 'POP review spreadsheet.xlsx'),
+        'payroll': os.path.join(directory, 'PayrollInfo.xlsx'),
+        'output': os.path.join(directory, 'Central Hub.xlsx'),
+    }
+
+    city_ids = np.arange(100000, 100000 + n_city_ids)
+    names = [
+        f"{WORDS[a]} {WORDS[b]} {SUFFIXES[c]}"
+        + (f" ({number})" if number % 4 == 0 else '')
+        for number, (a, b, c) in enumerate(zip(rng.integers(0, len(WORDS), n_city_ids),
+                                                rng.integers(0, len(WORDS), n_city_ids),
+                                                rng.integers(0, len(SUFFIXES), n_city_ids)))
+    ]
+    city_id_df = pd.DataFrame({
+        ci_column: city_ids,
+        'Sub-Contractor': names,
+        deviated_as_column: rng.choice(DEVIATIONS, n_city_ids),
+        'POP 3 Classification': rng.choice(CLASSIFICATIONS, n_city_ids),
+        'Alias 1': [name.upper() for name in names],
+        'Alias 2': [name.split(' (')[0].replace(',', '') for name in names],
+    })
+
+    hot_link_df = pd.DataFrame({
+        ci_column: rng.choice(city_ids, hot_link_rows),
+        'Deviation': rng.choice(DEVIATIONS, hot_link_rows),
+        'Amount': rng.integers(1000, 500000, hot_link_rows),
+        'Notes': rng.choice(WORDS, hot_link_rows),
+    })
+
+    tracking_rows = n_city_ids * 3
+    tracking_df = pd.DataFrame({
+        ci_column: rng.choice(city_ids, tracking_rows),
+        contract_column: rng.integers(5000, 250000, tracking_rows),
+    })
+    pop_df = pd.DataFrame({
+        ci_column: rng.choice(city_ids, n_city_ids),
+        'oldest date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 700, n_city_ids), unit='D'),
+        'weekly': rng.integers(0, 5000, n_city_ids),
+        'quarterly': rng.integers(0, 60000, n_city_ids),
+    })
+
+    # Payroll contractor names: exact aliases, names with a suffix variant, and misspellings for fuzzy matching
+    payroll_names = list(rng.choice(names, payroll_rows))
+    for row in rng.choice(payroll_rows, int(payroll_rows * fuzzy_share), replace=False):
+        name = payroll_names[row].split(' (')[0]
+        cut = int(rng.integers(1, len(name) - 1))
+        payroll_names[row] = name[:cut] + name[cut + 1:]
+    payroll_df = pd.DataFrame({
+        'Contractor': payroll_names,
+        'Value': rng.integers(100, 20000, payroll_rows),
+    })
+
+    with pd.ExcelWriter(paths['hot_link'], engine='openpyxl') as writer:
+        hot_link_df.to_excel(writer, index=False, sheet_name=HOT_LINK_sheet_name)
+    with pd.ExcelWriter(paths['city_id'], engine='openpyxl') as writer:
+        city_id_df.to_excel(writer, index=False, sheet_name=ci_hub)
+    with pd.ExcelWriter(paths['pop_review'], engine='openpyxl') as writer:
+        tracking_df.to_excel(writer, index=False, sheet_name=pop_POPTrackingWorkBook)
+        pop_df.to_excel(writer, index=False, sheet_name=sheet_pop)
+    with pd.ExcelWriter(paths['payroll'], engine='openpyxl') as writer:
+        payroll_df.to_excel(writer, index=False, sheet_name=payroll_sheet_name)
+    return paths
+
+
+def measure(name, func, rows, track_memory=True, setup=None):
+    """
+    Returns the wall time, rows per second and peak traced memory of func.
+    The timed run is untraced; peak memory comes from a second, traced run, because tracemalloc
+    slows Python code down several times and unevenly across stages. setup, if given, runs before
+    each of the two runs so both start from the same state.
+    """
+    if setup:
+        setup()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+
+    peak_mb = None
+    if track_memory:
+        if setup:
+            setup()
+        # Keep the traced run out of the instrumentation timers and counters
+        stats = My_Mods._instrumentation
+        My_Mods.disable_instrumentation()
+        tracemalloc.start()
+        try:
+            func()
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+            My_Mods._instrumentation = stats
+    return {
+        'benchmark': name,
+        'seconds': seconds,
+        'peak MB': peak_mb,
+        'rows': rows,
+        'rows/s': rows / seconds if seconds else None,
+    }
+
+
+def run_benchmarks(paths, track_memory=True):
+    """
+    Times the My_Mods entry points and the full Central Hub build against the generated workbooks.
+    """
+    results = []
+    hot_link_rows = len(pd.read_excel(paths['hot_link'], sheet_name=HOT_LINK_sheet_name))
+    payroll_names = pd.read_excel(paths['payroll'], sheet_name=payroll_sheet_name)['Contractor']
+    pop_df = pd.read_excel(paths['pop_review'], sheet_name=sheet_pop)
+    city_id_rows = len(pd.read_excel(paths['city_id'], sheet_name=ci_hub))
+
+    results.append(measure(
+        'extract_unique_city_ids',
+        lambda: My_Mods.extract_unique_city_ids(paths['hot_link'], HOT_LINK_sheet_name, ci_column),
+        hot_link_rows, track_memory))
+
+    finder = My_Mods.CityIdFinder(paths['city_id'], ci_hub)
+    results.append(measure('CityIdFinder load', finder.load_city_id_data, city_id_rows, track_memory))
+
+    exact_names = payroll_names[payroll_names.isin(finder.alias_index.keys())]
+    results.append(measure('CityIdFinder exact lookups', lambda: finder.find_city_ids(exact_names),
+                           len(exact_names), track_memory))
+    results.append(measure('CityIdFinder exact + fuzzy lookups', lambda: finder.find_city_ids(payroll_names),
+                           len(payroll_names), track_memory))
+
+    hub_ids = pop_df[ci_column].tolist()
+    results.append(measure(
+        'find_value_in_column',
+        lambda: My_Mods.find_value_in_column(pop_df, ci_column, hub_ids, 'weekly'),
+        len(hub_ids), track_memory))
+
+    write_path = os.path.join(os.path.dirname(paths['output']), 'write benchmark.xlsx')
+    results.append(measure(
+        'write_to_excel',
+        lambda: My_Mods.write_to_excel(pop_df, write_path, sheet_pop, mode='w'),
+        len(pop_df), track_memory))
+
+    pipeline = My_Mods.CentralHubPipeline(paths['hot_link'], paths['city_id'], paths['pop_review'], paths['output'])
+    results.append(measure('Central Hub build', pipeline.run, hot_link_rows, track_memory))
+
+    results.extend(run_refresh_benchmarks(paths, hot_link_rows, track_memory))
+    return pd.DataFrame(results)
+
+
+def run_refresh_benchmarks(paths, hot_link_rows, track_memory=True):
+    """
+    Times the flow central hub.py runs: sheet cache enabled plus run_incremental,
+    with a cold cache, with a warm cache and no input changes, and with a warm cache and no saved state.
+    """
+    directory = os.path.dirname(paths['output'])
+    state_file_path = os.path.join(directory, 'POP Hub state.json')
+
+    def refresh():
+        pipeline = My_Mods.CentralHubPipeline(paths['hot_link'], paths['city_id'], paths['pop_review'],
+                                              paths['output'])
+        return pipeline.run_incremental(state_file_path)
+
+    def remove_state():
+        if os.path.exists(state_file_path):
+            os.remove(state_file_path)
+
+    def reset():
+        cache.clear()
+        remove_state()
+
+    results = []
+    cache = My_Mods.enable_sheet_cache(os.path.join(directory, '.sheet_cache'))
+    try:
+        results.append(measure('Central Hub refresh (cold cache, full build)', refresh, hot_link_rows,
+                               track_memory, setup=reset))
+        # Each run above leaves a warm cache and a saved state behind
+        results.append(measure('Central Hub refresh (warm cache, no change)', refresh, hot_link_rows,
+                               track_memory))
+        results.append(measure('Central Hub refresh (warm cache, full build)', refresh, hot_link_rows,
+                               track_memory, setup=remove_state))
+    finally:
+        My_Mods.disable_sheet_cache()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark My_Mods and the Central Hub build on synthetic workbooks.")
+    parser.add_argument('--directory', default='benchmark_data', help="Where the synthetic workbooks are written")
+    parser.add_argument('--city-ids', type=int, default=2000, help="Number of City Ids in the City Id Hub")
+    parser.add_argument('--hot-link-rows', type=int, default=20000, help="Number of HOT LINK rows")
+    parser.add_argument('--payroll-rows', type=int, default=3000, help="Number of PayrollInfo contractor rows")
+    parser.add_argument('--fuzzy-share', type=float, default=0.1, help="Share of misspelled contractor names")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="Skip the second, tracemalloc-traced run of each benchmark that measures peak memory")
+    parser.add_argument('--csv', help="Also write the results to this CSV file")
+    args = parser.parse_args()
+
+    paths = generate_workbooks(args.directory, args.city_ids, args.hot_link_rows, args.payroll_rows, args.fuzzy_share)
+    stats = My_Mods.enable_instrumentation()
+    results_df = run_benchmarks(paths, track_memory=not args.no_memory)
+
+    pd.set_option('display.width', 120)
+    print(results_df.to_string(index=False))
+    print()
+    print(stats.report().to_string(index=False))
+    print()
+    for name, value in sorted(stats.counters.items()):
+        print(f"{name}: {value}")
+    if stats.errors:
+        print(f"{len(stats.errors)} errors reported, first: {stats.errors[0]}")
+
+    if args.csv:
+        results_df.to_csv(args.csv, index=False)
@@ -0,0 +1,32 @@
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+
+MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'my_mods.PY')
+
+
+def load_my_mods():
+    """
+    Imports my_mods.PY as My_Mods, skipping the calling test module when pandas, openpyxl or fuzzywuzzy
+    are missing. pyautogui is only used by track_mouse_position and cannot be imported on a headless
+    machine, so an empty stand-in is registered when it is unavailable.
+    """
+    for dependency in ('pandas', 'openpyxl', 'fuzzywuzzy'):
+        pytest.importorskip(dependency)
+    try:
+        import pyautogui  # noqa: F401
+    except Exception:
+        sys.modules['pyautogui'] = types.ModuleType('pyautogui')
+
+    if 'My_Mods' in sys.modules:
+        return sys.modules['My_Mods']
+    loader = importlib.machinery.SourceFileLoader('My_Mods', MODULE_PATH)
+    spec = importlib.util.spec_from_loader('My_Mods', loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['My_Mods'] = module
+    loader.exec_module(module)
+    return module
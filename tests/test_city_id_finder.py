@@ -0,0 +1,62 @@
+from conftest import load_my_mods
+
+My_Mods = load_my_mods()
+import pandas as pd  # noqa: E402
+
+
+def make_finder():
+    finder = My_Mods.CityIdFinder('unused.xlsx')
+    finder.city_id_df = pd.DataFrame({
+        'City Id': [10, 20, 30, 40],
+        'Sub-Contractor': ['Alpha Paving LLC', 'Beacon Builders, Inc.', 'Cedar Electric', 'Alpha Paving LLC'],
+        'Alias 1': ['ALPHA PAVING', 'Beacon', '  Cedar Elec  ', 'Delta Supply'],
+    })
+    return finder
+
+
+def test_exact_phases_match_find_city_id():
+    finder = make_finder()
+    names = ['Alpha Paving LLC', 'Beacon Builders, Inc. (sub)', 'Cedar Elec', 'Delta Supply', 'Beacon, Texas']
+    expected = [finder.find_city_id(name) for name in names]
+    assert expected == [10, 20, 30, 40, 20]
+    assert finder.find_city_ids(names).tolist() == expected
+
+
+def test_find_city_ids_keeps_index_and_order():
+    finder = make_finder()
+    names = pd.Series(['Delta Supply', None, 'Alpha Paving LLC', 'Delta Supply'], index=[7, 8, 9, 10])
+    city_ids = finder.find_city_ids(names)
+    assert city_ids.index.tolist() == [7, 8, 9, 10]
+    assert city_ids.tolist() == [40, "Not Found", 10, 40]
+
+
+def test_fuzzy_match_reports_alias_and_score():
+    finder = make_finder()
+    details = finder.find_city_ids(['Cedar Electrik', 'Zzyzx Holdings', 'Alpha Paving LLC'], return_details=True)
+    assert details['City Id'].tolist() == [30, "Not Found", 10]
+    assert details['Matched Alias'].iloc[0] == 'Cedar Electric'
+    assert details['Match Score'].iloc[0] >= 75
+    assert details['Match Score'].iloc[2] == 100
+
+
+def test_fuzzy_threshold():
+    finder = make_finder()
+    assert finder.find_city_ids(['Cedar Electrik'], threshold=100).tolist() == ["Not Found"]
+
+
+def test_numeric_name_does_not_abort_lookup():
+    finder = make_finder()
+    assert finder.find_city_ids([123, 'Beacon']).tolist() == ["Not Found", 20]
+
+
+def test_fuzzy_ties_go_to_earliest_alias():
+    index = My_Mods.FuzzyAliasIndex(make_finder().city_id_df)
+    # Rows 10 and 40 share the alias 'Alpha Paving LLC'
+    assert index.match('Alpha Paving LLC') == (10, 'Alpha Paving LLC', 100)
+
+
+def test_match_many_process_pool_matches_serial():
+    index = My_Mods.FuzzyAliasIndex(make_finder().city_id_df)
+    names = ['Cedar Electrik', 'Beacon Bilders Inc', 'Zzyzx Holdings', 'Delta Suply'] * 3
+    serial = index.match_many(names, max_workers=1)
+    assert index.match_many(names, max_workers=2, chunk_size=2) == serial
@@ -0,0 +1,81 @@
+import pytest
+
+from conftest import load_my_mods
+
+My_Mods = load_my_mods()
+import pandas as pd  # noqa: E402
+
+
+def hub():
+    return pd.DataFrame({
+        'Contract Amount': [250000, 150000, 250000, None, 180000, 500000],
+        'DEVIATED AS': ['Prime', 'Prime', 'Supplier', 'Prime', 'Supplier', None],
+        'POP 3 Classification': ['Construction', 'Goods', 'Goods', 'Construction', 'Goods', 'Goods'],
+    })
+
+
+def test_default_rules_match_baseline_apply():
+    df = hub()
+    expected = df.apply(
+        lambda row: 'Yes' if row['Contract Amount'] > 200000 and row['DEVIATED AS'] != 'Supplier' else 'No', axis=1
+    ).tolist()
+    result = My_Mods.add_pop_eligible_column(df, 'Contract Amount', 'DEVIATED AS')
+    assert result['POP Eligible'].tolist() == expected == ['Yes', 'No', 'No', 'No', 'No', 'Yes']
+
+
+def test_threshold_override_per_classification_and_report():
+    rules = My_Mods.pop_eligible_rules('Contract Amount', 'DEVIATED AS', classification_thresholds={'Goods': 100000})
+    df = My_Mods.evaluate_rules(hub(), [rules], report=True)
+    assert df['POP Eligible'].tolist() == ['Yes', 'Yes', 'No', 'No', 'No', 'Yes']
+    assert df['POP Eligible Rule'].tolist() == [
+        'Contract over threshold, not Supplier', 'Contract over threshold, not Supplier', 'Default',
+        'Default', 'Default', 'Contract over threshold, not Supplier',
+    ]
+
+
+def test_membership_override_is_evaluated_per_row():
+    rules = {
+        'column': 'Flag',
+        'rules': [{'name': 'allowed deviation', 'label': 'Y',
+                   'when': [('DEVIATED AS', 'in', {'by': 'POP 3 Classification',
+                                                   'values': {'Goods': 'Prime'}, 'default': 'Supplier'})]}],
+        'default': 'N',
+    }
+    df = My_Mods.evaluate_rules(hub(), rules)
+    # Construction rows need 'Supplier', Goods rows need 'Prime'
+    assert df['Flag'].tolist() == ['N', 'Y', 'N', 'N', 'N', 'N']
+
+    rules['rules'][0]['when'] = [('DEVIATED AS', 'not in', {'by': 'POP 3 Classification',
+                                                            'values': {'Goods': ['Prime', 'Supplier']},
+                                                            'default': ['Prime']})]
+    df = My_Mods.evaluate_rules(hub(), rules)
+    assert df['Flag'].tolist() == ['N', 'N', 'N', 'N', 'N', 'Y']
+
+
+def test_first_rule_wins_across_rule_sets():
+    rule_sets = [
+        {'column': 'Tier', 'default': 'Low', 'rules': [
+            {'name': 'large', 'label': 'High', 'when': [('Contract Amount', '>=', 250000)]},
+            {'name': 'medium', 'label': 'Mid', 'when': [('Contract Amount', '>', 100000)]},
+        ]},
+        {'column': 'Supplier', 'default': 'No', 'rules': [
+            {'name': 'supplier', 'label': 'Yes', 'when': [('DEVIATED AS', '==', 'Supplier')]},
+        ]},
+    ]
+    df = My_Mods.evaluate_rules(hub(), rule_sets, report=True)
+    assert df['Tier'].tolist() == ['High', 'Mid', 'High', 'Low', 'Mid', 'High']
+    assert df['Tier Rule'].tolist() == ['large', 'medium', 'large', 'Default', 'medium', 'large']
+    assert df['Supplier'].tolist() == ['No', 'No', 'Yes', 'No', 'Yes', 'No']
+
+
+def test_default_only_rule_set():
+    df = My_Mods.evaluate_rules(hub(), {'column': 'POP Eligible', 'rules': [], 'default': 'No'}, report=True)
+    assert set(df['POP Eligible']) == {'No'}
+    assert set(df['POP Eligible Rule']) == {'Default'}
+
+
+def test_unknown_operator():
+    rules = {'column': 'Flag', 'default': 'N',
+             'rules': [{'name': 'bad', 'label': 'Y', 'when': [('Contract Amount', '=>', 1)]}]}
+    with pytest.raises(ValueError, match="Unknown rule operator"):
+        My_Mods.evaluate_rules(hub(), rules)
@@ -0,0 +1,166 @@
+import os
+
+from conftest import load_my_mods
+
+My_Mods = load_my_mods()
+import pandas as pd  # noqa: E402
+
+BLANK = None
+
+
+def base_inputs():
+    return {
+        'hot_link': pd.DataFrame({'City Id': [1, 2, 3, 2, 1], 'Notes': ['a', 'b', 'c', 'd', 'e']}),
+        'city_id_hub': pd.DataFrame({
+            'City Id': [1, 2, 3, 4],
+            'Sub-Contractor': ['Alpha LLC', 'Beacon Inc.', 'Cedar Corp.', 'Delta Co.'],
+            'DEVIATED AS': ['Prime', 'Supplier', 'Prime', 'Prime'],
+            'POP 3 Classification': ['Construction', 'Goods', 'Construction', 'Goods'],
+        }),
+        'tracking': pd.DataFrame({'City Id': [1, 1, 2, 3, 4], 'Contract Amount': [150000, 100000, 300000, 100, 500000]}),
+        'pop_numbers': pd.DataFrame({
+            'City Id': [1, 2, 2, 3, 4],
+            'oldest date': pd.to_datetime(['2024-01-05', '2024-02-01', '2024-03-01', '2024-04-01', '2024-05-01']),
+            'weekly': [10, 20, 21, 30, 40],
+            'quarterly': [100, 200, 210, 300, 400],
+        }),
+    }
+
+
+def write_inputs(directory, inputs):
+    paths = {
+        'hot_link': os.path.join(directory, 'Link Deviations.xlsx'),
+        'city_id': os.path.join(directory, 'CITY ID.xlsx'),
+        'pop_review': os.path.join(directory, 'POP review spreadsheet.xlsx'),
+    }
+    with pd.ExcelWriter(paths['hot_link'], engine='openpyxl') as writer:
+        inputs['hot_link'].to_excel(writer, index=False, sheet_name='HOT LINK')
+    with pd.ExcelWriter(paths['city_id'], engine='openpyxl') as writer:
+        inputs['city_id_hub'].to_excel(writer, index=False, sheet_name='City Id Hub')
+    with pd.ExcelWriter(paths['pop_review'], engine='openpyxl') as writer:
+        inputs['tracking'].to_excel(writer, index=False, sheet_name='POPTrackingWorkBook')
+        inputs['pop_numbers'].to_excel(writer, index=False, sheet_name='POP numbers')
+    return paths
+
+
+def make_pipeline(paths, output_file_path):
+    return My_Mods.CentralHubPipeline(paths['hot_link'], paths['city_id'], paths['pop_review'], output_file_path)
+
+
+def refresh_and_compare(tmp_path, change):
+    """
+    Runs a full incremental refresh, applies change to the inputs, refreshes again and returns
+    (incremental hub, full build hub), both read back from their workbooks.
+    """
+    inputs = base_inputs()
+    paths = write_inputs(str(tmp_path), inputs)
+    output = str(tmp_path / 'Central Hub.xlsx')
+    state = str(tmp_path / 'POP Hub state.json')
+    assert make_pipeline(paths, output).run_incremental(state) is not None
+
+    change(inputs)
+    write_inputs(str(tmp_path), inputs)
+    assert make_pipeline(paths, output).run_incremental(state) is not None
+
+    full_output = str(tmp_path / 'Full Hub.xlsx')
+    assert make_pipeline(paths, full_output).run() is not None
+
+    return pd.read_excel(output, sheet_name='POP Hub'), pd.read_excel(full_output, sheet_name='POP Hub')
+
+
+def assert_same_hub(incremental_df, full_df):
+    pd.testing.assert_frame_equal(incremental_df, full_df, check_dtype=False)
+    assert not incremental_df.duplicated().any()
+
+
+def test_added_id(tmp_path):
+    def change(inputs):
+        inputs['hot_link'] = pd.concat([inputs['hot_link'], pd.DataFrame({'City Id': [4], 'Notes': ['f']})],
+                                       ignore_index=True)
+    incremental_df, full_df = refresh_and_compare(tmp_path, change)
+    assert 4 in incremental_df['City Id'].tolist()
+    assert_same_hub(incremental_df, full_df)
+
+
+def test_removed_id(tmp_path):
+    def change(inputs):
+        inputs['hot_link'] = inputs['hot_link'][inputs['hot_link']['City Id'] != 2]
+    incremental_df, full_df = refresh_and_compare(tmp_path, change)
+    assert 2 not in incremental_df['City Id'].tolist()
+    assert_same_hub(incremental_df, full_df)
+
+
+def test_changed_contract_amount(tmp_path):
+    def change(inputs):
+        inputs['tracking'].loc[inputs['tracking']['City Id'] == 3, 'Contract Amount'] = 999999
+    incremental_df, full_df = refresh_and_compare(tmp_path, change)
+    row = incremental_df[incremental_df['City Id'] == 3].iloc[0]
+    assert row['Contract Amount'] == 999999
+    assert row['POP Eligible'] == 'Yes'
+    assert_same_hub(incremental_df, full_df)
+
+
+def test_reordered_pop_numbers(tmp_path):
+    def change(inputs):
+        inputs['pop_numbers'] = inputs['pop_numbers'].iloc[[0, 2, 1, 3, 4]].reset_index(drop=True)
+    incremental_df, full_df = refresh_and_compare(tmp_path, change)
+    assert incremental_df.loc[incremental_df['City Id'] == 2, 'weekly'].iloc[0] == 21
+    assert_same_hub(incremental_df, full_df)
+
+
+def test_no_change(tmp_path):
+    incremental_df, full_df = refresh_and_compare(tmp_path, lambda inputs: None)
+    assert_same_hub(incremental_df, full_df)
+
+
+def test_blank_city_id_cells(tmp_path):
+    # Blank City Id cells make pandas read those columns as float (1.0 instead of 1)
+    def add_blanks(inputs):
+        inputs['hot_link'] = pd.concat([inputs['hot_link'], pd.DataFrame({'City Id': [BLANK], 'Notes': ['x']})],
+                                       ignore_index=True)
+        inputs['tracking'] = pd.concat([inputs['tracking'],
+                                        pd.DataFrame({'City Id': [BLANK], 'Contract Amount': [5]})],
+                                       ignore_index=True)
+
+    def change(inputs):
+        add_blanks(inputs)
+        inputs['tracking'].loc[inputs['tracking']['City Id'] == 1, 'Contract Amount'] = [999999, 0]
+
+    inputs = base_inputs()
+    add_blanks(inputs)
+    paths = write_inputs(str(tmp_path), inputs)
+    output = str(tmp_path / 'Central Hub.xlsx')
+    state = str(tmp_path / 'POP Hub state.json')
+    make_pipeline(paths, output).run_incremental(state)
+
+    inputs = base_inputs()
+    change(inputs)
+    write_inputs(str(tmp_path), inputs)
+    make_pipeline(paths, output).run_incremental(state)
+    full_output = str(tmp_path / 'Full Hub.xlsx')
+    make_pipeline(paths, full_output).run()
+
+    incremental_df = pd.read_excel(output, sheet_name='POP Hub')
+    full_df = pd.read_excel(full_output, sheet_name='POP Hub')
+    assert incremental_df['City Id'].tolist().count(1) == 1
+    assert incremental_df.loc[incremental_df['City Id'] == 1, 'Contract Amount'].iloc[0] == 999999
+    assert_same_hub(incremental_df, full_df)
+
+
+def test_failed_hub_write_keeps_previous_state(tmp_path, monkeypatch):
+    inputs = base_inputs()
+    paths = write_inputs(str(tmp_path), inputs)
+    output = str(tmp_path / 'Central Hub.xlsx')
+    state = str(tmp_path / 'POP Hub state.json')
+    make_pipeline(paths, output).run_incremental(state)
+
+    inputs['tracking'].loc[inputs['tracking']['City Id'] == 3, 'Contract Amount'] = 999999
+    write_inputs(str(tmp_path), inputs)
+    # e.g. Central Hub.xlsx open in Excel
+    with monkeypatch.context() as patch:
+        patch.setattr(My_Mods, 'write_to_excel', lambda *args, **kwargs: False)
+        make_pipeline(paths, output).run_incremental(state)
+
+    make_pipeline(paths, output).run_incremental(state)
+    hub_df = pd.read_excel(output, sheet_name='POP Hub')
+    assert hub_df.loc[hub_df['City Id'] == 3, 'Contract Amount'].iloc[0] == 999999
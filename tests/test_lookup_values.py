@@ -0,0 +1,45 @@
+from conftest import load_my_mods
+
+My_Mods = load_my_mods()
+import pandas as pd  # noqa: E402
+
+
+def pop_numbers():
+    return pd.DataFrame({
+        'City Id': [1, 2, 2, 3],
+        'oldest date': pd.to_datetime(['2024-01-05', '2024-02-01', '2024-03-01', '2024-04-01']),
+        'weekly': [10, 20, 21, 30],
+    })
+
+
+def test_datetime_return_column_keeps_timestamps():
+    result = My_Mods.find_value_in_column(pop_numbers(), 'City Id', [2], 'oldest date')
+    assert result['oldest date'].iloc[0] == pd.Timestamp('2024-02-01')
+    assert isinstance(result['oldest date'].iloc[0], pd.Timestamp)
+
+
+def test_multiple_columns_first_match_order_and_not_found():
+    df = pop_numbers()
+    index = My_Mods.build_column_index(df, 'City Id')
+    result = My_Mods.lookup_values(df, 'City Id', [3, 9, 2, 1], ['weekly', 'oldest date'], index=index)
+    assert result.columns.tolist() == ['City Id', 'weekly', 'oldest date']
+    assert result['City Id'].tolist() == [3, 9, 2, 1]
+    assert result['weekly'].tolist() == [30, "Not Found", 20, 10]
+    assert result['oldest date'].tolist() == [pd.Timestamp('2024-04-01'), "Not Found",
+                                              pd.Timestamp('2024-02-01'), pd.Timestamp('2024-01-05')]
+
+
+def test_matches_baseline_scan():
+    df = pop_numbers()
+    search_values = [2, 3, 7, 1.0]
+    expected = []
+    for value in search_values:
+        matched_rows = df.loc[df['City Id'] == value]
+        expected.append(matched_rows['weekly'].iloc[0] if not matched_rows.empty else "Not Found")
+    assert My_Mods.find_value_in_column(df, 'City Id', search_values, 'weekly')['weekly'].tolist() == expected
+
+
+def test_missing_columns_fill_not_found():
+    df = pop_numbers()
+    assert My_Mods.find_value_in_column(df, 'City Id', [1], 'quarterly')['quarterly'].tolist() == ["Not Found"]
+    assert My_Mods.find_value_in_column(df, 'Missing', [1], 'weekly')['weekly'].tolist() == ["Not Found"]
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from conftest import load_my_mods
+
+My_Mods = load_my_mods()
+import pandas as pd  # noqa: E402
+
+
+def write_sheet(path, df, sheet_name='Data'):
+    df.to_excel(path, index=False, sheet_name=sheet_name)
+    # Make sure the rewrite is visible in mtime even on coarse file system clocks
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def stats():
+    yield My_Mods.enable_instrumentation()
+    My_Mods.disable_instrumentation()
+
+
+def test_hit_after_first_read(tmp_path, stats):
+    path = str(tmp_path / 'book.xlsx')
+    write_sheet(path, pd.DataFrame({'City Id': [1, 2], 'Name': ['a', 'b']}))
+    cache = My_Mods.SheetCache(str(tmp_path / 'cache'))
+
+    first = cache.read_excel(path, sheet_name='Data')
+    second = cache.read_excel(path, sheet_name='Data')
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(second, pd.read_excel(path, sheet_name='Data'))
+    assert stats.counters['sheet cache miss'] == 1
+    assert stats.counters['sheet cache hit'] == 1
+
+
+def test_changed_workbook_is_parsed_again(tmp_path, stats):
+    path = str(tmp_path / 'book.xlsx')
+    write_sheet(path, pd.DataFrame({'City Id': [1, 2]}))
+    cache = My_Mods.SheetCache(str(tmp_path / 'cache'))
+    cache.read_excel(path, sheet_name='Data')
+
+    write_sheet(path, pd.DataFrame({'City Id': [1, 2, 3]}))
+    assert cache.read_excel(path, sheet_name='Data')['City Id'].tolist() == [1, 2, 3]
+    assert stats.counters['sheet cache miss'] == 2
+    # The entry for the old version was dropped
+    assert len(os.listdir(cache.cache_dir)) == 1
+
+
+def test_mixed_types_fall_back_to_pickle(tmp_path):
+    path = str(tmp_path / 'book.xlsx')
+    write_sheet(path, pd.DataFrame({'weekly': [10, 'Not Found', 30]}))
+    cache = My_Mods.SheetCache(str(tmp_path / 'cache'))
+    cache.read_excel(path, sheet_name='Data')
+    assert cache.read_excel(path, sheet_name='Data')['weekly'].tolist() == [10, 'Not Found', 30]
+
+
+def test_eviction_keeps_cache_under_max_bytes(tmp_path):
+    cache = My_Mods.SheetCache(str(tmp_path / 'cache'), max_bytes=1)
+    for number in range(3):
+        path = str(tmp_path / f'book {number}.xlsx')
+        write_sheet(path, pd.DataFrame({'City Id': range(100)}))
+        cache.read_excel(path, sheet_name='Data')
+    assert os.listdir(cache.cache_dir) == []
+
+
+def test_module_read_excel_uses_enabled_cache(tmp_path, stats):
+    path = str(tmp_path / 'book.xlsx')
+    write_sheet(path, pd.DataFrame({'City Id': [1]}))
+    My_Mods.enable_sheet_cache(str(tmp_path / 'cache'))
+    try:
+        My_Mods.read_excel(path, sheet_name='Data')
+        My_Mods.read_excel(path, sheet_name='Data')
+    finally:
+        My_Mods.disable_sheet_cache()
+    assert stats.counters['sheet cache hit'] == 1
@@ -0,0 +1,57 @@
+from conftest import load_my_mods
+
+My_Mods = load_my_mods()
+import openpyxl  # noqa: E402
+import pandas as pd  # noqa: E402
+
+
+def write_hot_link(path, city_ids):
+    pd.DataFrame({
+        'Notes': [f"note {number}" for number in range(len(city_ids))],
+        'City Id': city_ids,
+        'Amount': range(len(city_ids)),
+    }).to_excel(path, index=False, sheet_name='HOT LINK')
+
+
+def test_read_data_matches_full_load(tmp_path):
+    path = str(tmp_path / 'book.xlsx')
+    write_hot_link(path, [5, 6, 7])
+    worksheet = openpyxl.load_workbook(path)['HOT LINK']
+    rows = worksheet.iter_rows(min_row=2, max_row=4, min_col=2, max_col=3)
+    expected = [[cell.value for cell in row] for row in rows]
+    assert My_Mods.read_data(path, 'HOT LINK', start_row=2, start_col=2) == expected
+    assert My_Mods.read_data(path, 'Missing') == []
+
+
+def test_iter_sheet_chunks_projects_columns(tmp_path):
+    path = str(tmp_path / 'book.xlsx')
+    write_hot_link(path, list(range(25)))
+    chunks = list(My_Mods.iter_sheet_chunks(path, 'HOT LINK', ['Amount', 'City Id'], chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[0].columns.tolist() == ['Amount', 'City Id']
+    assert pd.concat(chunks)['City Id'].tolist() == list(range(25))
+
+
+def test_distinct_values_drops_default_na_strings(tmp_path):
+    path = str(tmp_path / 'book.xlsx')
+    write_hot_link(path, [5, '#N/A', 7, 'N/A', None, 5])
+    expected = pd.read_excel(path, sheet_name='HOT LINK')['City Id'].dropna().unique().tolist()
+    assert expected == [5.0, 7.0]
+    assert My_Mods.distinct_values(path, 'HOT LINK', 'City Id').tolist() == expected
+
+
+def test_extract_unique_city_ids_same_with_and_without_cache(tmp_path):
+    path = str(tmp_path / 'book.xlsx')
+    write_hot_link(path, [3, 1, 3, 2, 1])
+    baseline = pd.read_excel(path, sheet_name='HOT LINK')['City Id'].dropna().unique().tolist()
+
+    uncached = My_Mods.extract_unique_city_ids(path, 'HOT LINK', 'City Id')
+    My_Mods.enable_sheet_cache(str(tmp_path / 'cache'))
+    try:
+        cold = My_Mods.extract_unique_city_ids(path, 'HOT LINK', 'City Id')
+        warm = My_Mods.extract_unique_city_ids(path, 'HOT LINK', 'City Id')
+    finally:
+        My_Mods.disable_sheet_cache()
+
+    for result in (uncached, cold, warm):
+        assert result['City Id'].tolist() == baseline == [3, 1, 2]
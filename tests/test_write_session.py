@@ -0,0 +1,68 @@
+import pytest
+
+from conftest import load_my_mods
+
+My_Mods = load_my_mods()
+import openpyxl  # noqa: E402
+import pandas as pd  # noqa: E402
+from openpyxl.styles import Font  # noqa: E402
+
+
+def make_report(path):
+    workbook = openpyxl.Workbook()
+    summary = workbook.active
+    summary.title = 'Summary'
+    summary['B2'].font = Font(bold=True)
+    workbook.create_sheet('Details')['A1'] = 'old'
+    workbook.save(path)
+
+
+def test_session_applies_pastes_and_frames_once(tmp_path):
+    path = str(tmp_path / 'report.xlsx')
+    make_report(path)
+    df = pd.DataFrame({'City Id': [1, 2], 'weekly': [10.0, None]})
+
+    with My_Mods.WorkbookWriteSession(path) as session:
+        My_Mods.paste_data_as_values(path, 'Summary', [['x', 'y'], ['z', 'w']], 2, 2, session=session)
+        My_Mods.write_to_excel(df, path, 'Details', session=session)
+        workbook = openpyxl.load_workbook(path)
+        assert workbook['Summary']['B2'].value is None  # Nothing saved before the block ends
+
+    workbook = openpyxl.load_workbook(path)
+    summary = workbook['Summary']
+    assert [[cell.value for cell in row] for row in summary.iter_rows(min_row=2, min_col=2, max_col=3)] == \
+        [['x', 'y'], ['z', 'w']]
+    assert summary['B2'].font.bold
+    assert workbook.sheetnames == ['Summary', 'Details']
+    assert [list(row) for row in workbook['Details'].iter_rows(values_only=True)] == \
+        [['City Id', 'weekly'], [1, 10], [2, None]]
+
+
+def test_session_not_saved_when_block_fails(tmp_path):
+    path = str(tmp_path / 'report.xlsx')
+    make_report(path)
+    with pytest.raises(RuntimeError):
+        with My_Mods.WorkbookWriteSession(path) as session:
+            session.paste('Summary', [['x']])
+            raise RuntimeError
+    assert openpyxl.load_workbook(path)['Summary']['A1'].value is None
+
+
+def test_new_workbook_session(tmp_path):
+    path = str(tmp_path / 'new.xlsx')
+    with My_Mods.WorkbookWriteSession(path, new_workbook=True) as session:
+        session.write_dataframe(pd.DataFrame({'City Id': [1]}), 'POP Hub')
+    assert openpyxl.load_workbook(path).sheetnames == ['POP Hub']
+
+
+def test_session_rejects_other_workbook_and_write_mode(tmp_path):
+    path = str(tmp_path / 'report.xlsx')
+    make_report(path)
+    session = My_Mods.WorkbookWriteSession(path)
+    with pytest.raises(ValueError):
+        My_Mods.paste_data_as_values(str(tmp_path / 'other.xlsx'), 'Summary', [['x']], session=session)
+    with pytest.raises(ValueError):
+        My_Mods.write_to_excel(pd.DataFrame(), str(tmp_path / 'other.xlsx'), 'Details', session=session)
+    with pytest.raises(ValueError):
+        My_Mods.write_to_excel(pd.DataFrame(), path, 'Details', mode='w', session=session)
+    assert session.operations == []